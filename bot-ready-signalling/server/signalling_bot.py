@@ -76,7 +76,7 @@ async def main():
         # Register an event handler so we can play the audio when we receive a specific message
         @transport.event_handler("on_app_message")
         async def on_app_message(transport, message, sender):
-            logger.debug(f"Received app message: {message} - {sender}")
+            logger.debug("Received app message: {} - {}", message, sender)
             if "playable" not in message:
                 return
             await worker.queue_frames(
@@ -21,15 +21,12 @@ import sys
 
 from dotenv import load_dotenv
 from loguru import logger
-from PIL import Image
 from pipecat.audio.vad.silero import SileroVADAnalyzer
 from pipecat.frames.frames import (
     BotStartedSpeakingFrame,
     BotStoppedSpeakingFrame,
     Frame,
     LLMRunFrame,
-    OutputImageRawFrame,
-    SpriteFrame,
 )
 from pipecat.pipeline.pipeline import Pipeline
 from pipecat.pipeline.worker import PipelineParams, PipelineWorker
@@ -43,6 +40,13 @@ from pipecat.services.google.gemini_live.llm import GeminiLiveLLMService
 from pipecat.transports.daily.transport import DailyParams, DailyTransport
 from pipecat.workers.runner import WorkerRunner
 
+# The bots are imported as src.bot_* by app.py and as top-level modules by
+# runner.py, so support both.
+try:
+    from .sprites import load_sprites
+except ImportError:
+    from sprites import load_sprites
+
 load_dotenv(override=True)
 
 try:
@@ -52,24 +56,15 @@ except ValueError:
     # Handle the case where logger is already initialized
     pass
 
-sprites = []
-script_dir = os.path.dirname(__file__)
+# Read API keys once at import, so a missing key is reported at startup
+# instead of when the first session connects
+GOOGLE_API_KEY = os.getenv("GOOGLE_API_KEY")
 
-for i in range(1, 26):
-    # Build the full path to the image file
-    full_path = os.path.join(script_dir, f"assets/robot0{i}.png")
-    # Get the filename without the extension to use as the dictionary key
-    # Open the image and convert it to bytes
-    with Image.open(full_path) as img:
-        sprites.append(OutputImageRawFrame(image=img.tobytes(), size=img.size, format=img.format))
+if not GOOGLE_API_KEY:
+    logger.error("GOOGLE_API_KEY is not set")
 
-# Create a smooth animation by adding reversed frames
-flipped = sprites[::-1]
-sprites.extend(flipped)
-
-# Define static and animated states
-quiet_frame = sprites[0]  # Static frame for when bot is listening
-talking_frame = SpriteFrame(images=sprites)  # Animation sequence for when bot is talking
+# Static frame for when bot is listening, and animation for when bot is talking
+quiet_frame, talking_frame = load_sprites(os.path.join(os.path.dirname(__file__), "assets"))
 
 
 class TalkingAnimation(FrameProcessor):
@@ -92,15 +87,20 @@ class TalkingAnimation(FrameProcessor):
         """
         await super().process_frame(frame, direction)
 
+        # Every frame in the pipeline passes through here. Neither speaking frame
+        # has subclasses, so an exact type check is enough and skips isinstance.
+        frame_type = type(frame)
+
         # Switch to talking animation when bot starts speaking
-        if isinstance(frame, BotStartedSpeakingFrame):
+        if frame_type is BotStartedSpeakingFrame:
             if not self._is_talking:
                 await self.push_frame(talking_frame)
                 self._is_talking = True
         # Return to static frame when bot stops speaking
-        elif isinstance(frame, BotStoppedSpeakingFrame):
-            await self.push_frame(quiet_frame)
-            self._is_talking = False
+        elif frame_type is BotStoppedSpeakingFrame:
+            if self._is_talking:
+                await self.push_frame(quiet_frame)
+                self._is_talking = False
 
         await self.push_frame(frame, direction)
 
@@ -131,7 +131,7 @@ async def run_bot(room_url: str, token: str):
 
     # Initialize the Gemini Live model
     llm = GeminiLiveLLMService(
-        api_key=os.getenv("GOOGLE_API_KEY"),
+        api_key=GOOGLE_API_KEY,
         settings=GeminiLiveLLMService.Settings(
             voice="Puck",  # Aoede, Charon, Fenrir, Kore, Puck
             system_instruction="You are Chatbot, a friendly, helpful robot. Your goal is to demonstrate your capabilities in a succinct way. Your output will be converted to audio so don't include special characters in your answers. Respond to what the user said in a creative and helpful way, but keep your responses brief. Start by introducing yourself.",
@@ -22,15 +22,12 @@ import sys
 
 from dotenv import load_dotenv
 from loguru import logger
-from PIL import Image
 from pipecat.audio.vad.silero import SileroVADAnalyzer
 from pipecat.frames.frames import (
     BotStartedSpeakingFrame,
     BotStoppedSpeakingFrame,
     Frame,
     LLMRunFrame,
-    OutputImageRawFrame,
-    SpriteFrame,
 )
 from pipecat.pipeline.pipeline import Pipeline
 from pipecat.pipeline.worker import PipelineParams, PipelineWorker
@@ -45,6 +42,13 @@ from pipecat.services.openai.llm import OpenAILLMService
 from pipecat.transports.daily.transport import DailyParams, DailyTransport
 from pipecat.workers.runner import WorkerRunner
 
+# The bots are imported as src.bot_* by app.py and as top-level modules by
+# runner.py, so support both.
+try:
+    from .sprites import load_sprites
+except ImportError:
+    from sprites import load_sprites
+
 load_dotenv(override=True)
 
 try:
@@ -54,25 +58,20 @@ except ValueError:
     # Handle the case where logger is already initialized
     pass
 
-sprites = []
-script_dir = os.path.dirname(__file__)
+# Read API keys once at import, so a missing key is reported at startup
+# instead of when the first session connects
+ELEVENLABS_API_KEY = os.getenv("ELEVENLABS_API_KEY")
+OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
 
-# Load sequential animation frames
-for i in range(1, 26):
-    # Build the full path to the image file
-    full_path = os.path.join(script_dir, f"assets/robot0{i}.png")
-    # Get the filename without the extension to use as the dictionary key
-    # Open the image and convert it to bytes
-    with Image.open(full_path) as img:
-        sprites.append(OutputImageRawFrame(image=img.tobytes(), size=img.size, format=img.format))
+for _name, _value in (
+    ("ELEVENLABS_API_KEY", ELEVENLABS_API_KEY),
+    ("OPENAI_API_KEY", OPENAI_API_KEY),
+):
+    if not _value:
+        logger.error(f"{_name} is not set")
 
-# Create a smooth animation by adding reversed frames
-flipped = sprites[::-1]
-sprites.extend(flipped)
-
-# Define static and animated states
-quiet_frame = sprites[0]  # Static frame for when bot is listening
-talking_frame = SpriteFrame(images=sprites)  # Animation sequence for when bot is talking
+# Static frame for when bot is listening, and animation for when bot is talking
+quiet_frame, talking_frame = load_sprites(os.path.join(os.path.dirname(__file__), "assets"))
 
 
 class TalkingAnimation(FrameProcessor):
@@ -95,15 +94,20 @@ class TalkingAnimation(FrameProcessor):
         """
         await super().process_frame(frame, direction)
 
+        # Every frame in the pipeline passes through here. Neither speaking frame
+        # has subclasses, so an exact type check is enough and skips isinstance.
+        frame_type = type(frame)
+
         # Switch to talking animation when bot starts speaking
-        if isinstance(frame, BotStartedSpeakingFrame):
+        if frame_type is BotStartedSpeakingFrame:
             if not self._is_talking:
                 await self.push_frame(talking_frame)
                 self._is_talking = True
         # Return to static frame when bot stops speaking
-        elif isinstance(frame, BotStoppedSpeakingFrame):
-            await self.push_frame(quiet_frame)
-            self._is_talking = False
+        elif frame_type is BotStoppedSpeakingFrame:
+            if self._is_talking:
+                await self.push_frame(quiet_frame)
+                self._is_talking = False
 
         await self.push_frame(frame, direction)
 
@@ -143,7 +147,7 @@ async def run_bot(room_url: str, token: str):
 
     # Initialize text-to-speech service
     tts = ElevenLabsTTSService(
-        api_key=os.getenv("ELEVENLABS_API_KEY"),
+        api_key=ELEVENLABS_API_KEY,
         settings=ElevenLabsTTSService.Settings(
             voice="SAz9YHcvj6GT2YYXdXww",
             # Spanish
@@ -153,7 +157,7 @@ async def run_bot(room_url: str, token: str):
 
     # Initialize LLM service
     llm = OpenAILLMService(
-        api_key=os.getenv("OPENAI_API_KEY"),
+        api_key=OPENAI_API_KEY,
         settings=OpenAILLMService.Settings(
             system_instruction="You are an incessant one-upper. Start by asking the user how their day is going.",
             # Spanish
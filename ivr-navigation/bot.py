@@ -46,6 +46,31 @@ async def end_call(params: FunctionCallParams, reason: str):
     await params.llm.push_frame(EndWorkerFrame())
 
 
+class DialoutState:
+    """Per-call dialout state shared by the transport event handlers."""
+
+    __slots__ = ("max_retries", "retry_count", "successful", "params")
+
+    def __init__(self, max_retries: int = 5):
+        self.max_retries = max_retries
+        self.retry_count = 0
+        self.successful = False
+        self.params: dict = {}
+
+
+async def attempt_dialout(state: DialoutState, transport: BaseTransport):
+    """Attempt to start dialout with retry logic."""
+    if state.retry_count < state.max_retries and not state.successful:
+        state.retry_count += 1
+        phone_number = state.params.get("phoneNumber", "unknown")
+        logger.info(
+            f"Attempting dialout (attempt {state.retry_count}/{state.max_retries}) to: {phone_number}"
+        )
+        await transport.start_dialout(state.params)
+    else:
+        logger.error(f"Maximum retry attempts ({state.max_retries}) reached. Giving up on dialout.")
+
+
 async def run_bot(transport: BaseTransport, handle_sigint: bool) -> None:
     """Run the voice bot with the given parameters."""
 
@@ -96,24 +121,7 @@ Relevant information:
         ),
     )
 
-    # ------------ RETRY LOGIC VARIABLES ------------
-    max_retries = 5
-    retry_count = 0
-    dialout_successful = False
-
-    async def attempt_dialout(dialout_params):
-        """Attempt to start dialout with retry logic."""
-        nonlocal retry_count, dialout_successful
-
-        if retry_count < max_retries and not dialout_successful:
-            retry_count += 1
-            phone_number = dialout_params.get("phoneNumber", "unknown")
-            logger.info(
-                f"Attempting dialout (attempt {retry_count}/{max_retries}) to: {phone_number}"
-            )
-            await transport.start_dialout(dialout_params)
-        else:
-            logger.error(f"Maximum retry attempts ({max_retries}) reached. Giving up on dialout.")
+    dialout_state = DialoutState()
 
     @transport.event_handler("on_joined")
     async def on_joined(transport, data):
@@ -136,7 +144,8 @@ Relevant information:
 
         logger.debug(f"Dialout parameters: {dialout_params}")
         logger.debug(f"Dialout settings detected; starting dialout to number: {phone_number}")
-        await attempt_dialout(dialout_params)
+        dialout_state.params = dialout_params
+        await attempt_dialout(dialout_state, transport)
 
     @transport.event_handler("on_dialout_connected")
     async def on_dialout_connected(transport, data):
@@ -144,30 +153,22 @@ Relevant information:
 
     @transport.event_handler("on_dialout_answered")
     async def on_dialout_answered(transport, data):
-        nonlocal dialout_successful
         logger.debug(f"Dial-out answered: {data}")
-        dialout_successful = True  # Mark as successful to stop retries
+        dialout_state.successful = True  # Mark as successful to stop retries
         # The bot will wait to hear the user before the bot speaks
 
     @transport.event_handler("on_dialout_error")
     async def on_dialout_error(transport, data: Any):
-        logger.error(f"Dial-out error (attempt {retry_count}/{max_retries}): {data}")
-
-        if retry_count < max_retries:
-            # Get dialout params again for retry
-            body_data = getattr(transport, "_body_data", {})
-            dialout_settings = body_data.get("dialout_settings", {})
-            phone_number = dialout_settings.get("phone_number")
-            caller_id = dialout_settings.get("caller_id")
-
-            dialout_params = {"phoneNumber": phone_number}
-            if caller_id:
-                dialout_params["callerId"] = caller_id
-
-            logger.info(f"Retrying dialout")
-            await attempt_dialout(dialout_params)
+        logger.error(
+            f"Dial-out error (attempt {dialout_state.retry_count}/{dialout_state.max_retries}): {data}"
+        )
+
+        if dialout_state.retry_count < dialout_state.max_retries:
+            # Retry with the parameters built when we joined
+            logger.info("Retrying dialout")
+            await attempt_dialout(dialout_state, transport)
         else:
-            logger.error(f"All {max_retries} dialout attempts failed. Stopping bot.")
+            logger.error(f"All {dialout_state.max_retries} dialout attempts failed. Stopping bot.")
             await worker.cancel()
 
     @transport.event_handler("on_first_participant_joined")
@@ -25,7 +25,7 @@ import aiohttp
 import uvicorn
 from dotenv import load_dotenv
 from fastapi import FastAPI, HTTPException, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from loguru import logger
 from pipecat.runner.daily import configure
 from pipecat.runner.types import DailyRunnerArguments
@@ -37,11 +37,32 @@ load_dotenv()
 # ----------------- API ----------------- #
 
 
+# Daily sends a tiny {"test": true} body to verify the webhook; answer it with a
+# prebuilt body instead of decoding JSON
+_TEST_RESPONSE_BODY = b'{"test":true}'
+
+# Strong references to running bots so their tasks aren't garbage collected
+BOT_TASKS: set[asyncio.Task] = set()
+
+
+def _on_bot_task_done(task: asyncio.Task):
+    """Log bot failures so background tasks don't fail silently."""
+    BOT_TASKS.discard(task)
+    if task.cancelled():
+        logger.warning(f"Bot task {task.get_name()} was cancelled")
+    elif exc := task.exception():
+        logger.opt(exception=exc).error(f"Bot task {task.get_name()} failed: {exc}")
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Create aiohttp session to be used for Daily API calls
     app.state.session = aiohttp.ClientSession()
     yield
+    # Cancel any bots still running when shutting down
+    for task in list(BOT_TASKS):
+        task.cancel()
+    await asyncio.gather(*BOT_TASKS, return_exceptions=True)
     # Close session when shutting down
     await app.state.session.close()
 
@@ -50,7 +71,7 @@ app = FastAPI(lifespan=lifespan)
 
 
 @app.post("/start")
-async def handle_dial_out_request(request: Request) -> JSONResponse:
+async def handle_dial_out_request(request: Request) -> Response:
     """Handle dial-out request.
 
     This endpoint:
@@ -66,11 +87,13 @@ async def handle_dial_out_request(request: Request) -> JSONResponse:
 
     # Get the dial-out properties from the request
     try:
-        data = await request.json()
+        raw_body = await request.body()
 
         # Handle webhook test requests
-        if "test" in data:
-            return JSONResponse({"test": True})
+        if len(raw_body) < 64 and b'"test"' in raw_body:
+            return Response(content=_TEST_RESPONSE_BODY, media_type="application/json")
+
+        data = json.loads(raw_body)
 
         if not data.get("dialout_settings"):
             raise HTTPException(
@@ -218,7 +241,9 @@ async def start_bot_endpoint(request: Request):
         runner_args.handle_sigint = False
 
         # Start the bot in the background
-        asyncio.create_task(bot_function(runner_args))
+        task = asyncio.create_task(bot_function(runner_args), name=f"bot-{phone_number}")
+        BOT_TASKS.add(task)
+        task.add_done_callback(_on_bot_task_done)
 
         return {"status": "Bot started successfully", "phone_number": phone_number}
 
@@ -36,11 +36,28 @@ load_dotenv()
 # ----------------- API ----------------- #
 
 
+# Strong references to running bots so their tasks aren't garbage collected
+BOT_TASKS: set[asyncio.Task] = set()
+
+
+def _on_bot_task_done(task: asyncio.Task):
+    """Log bot failures so background tasks don't fail silently."""
+    BOT_TASKS.discard(task)
+    if task.cancelled():
+        logger.warning(f"Bot task {task.get_name()} was cancelled")
+    elif exc := task.exception():
+        logger.opt(exception=exc).error(f"Bot task {task.get_name()} failed: {exc}")
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Create aiohttp session to be used for Daily API calls
     app.state.session = aiohttp.ClientSession()
     yield
+    # Cancel any bots still running when shutting down
+    for task in list(BOT_TASKS):
+        task.cancel()
+    await asyncio.gather(*BOT_TASKS, return_exceptions=True)
     # Close session when shutting down
     await app.state.session.close()
 
@@ -208,7 +225,9 @@ async def start_bot_endpoint(request: Request):
         runner_args.handle_sigint = False
 
         # Start the bot in the background
-        asyncio.create_task(bot_function(runner_args))
+        task = asyncio.create_task(bot_function(runner_args), name=f"bot-{call_id}")
+        BOT_TASKS.add(task)
+        task.add_done_callback(_on_bot_task_done)
 
         return {"status": "Bot started successfully", "call_id": call_id}
 
@@ -10,7 +10,9 @@ This bot demonstrates how to make outbound phone calls using Daily's PSTN capabi
 The bot initiates a call to a specified phone number and conducts a voice conversation.
 """
 
+import asyncio
 import os
+import random
 from typing import Any, Optional
 
 from dotenv import load_dotenv
@@ -40,12 +42,16 @@ class DialoutManager:
     """Manages dialout attempts with retry logic.
 
     Handles the complexity of initiating outbound calls with automatic retry
-    on failure, up to a configurable maximum number of attempts.
+    on failure, up to a configurable maximum number of attempts. Retries are
+    delayed with exponential backoff plus jitter so a failing endpoint isn't
+    hammered with back-to-back attempts.
 
     Args:
         transport: The Daily transport instance for making the dialout
         dialout_settings: Settings containing phone number and optional caller ID
         max_retries: Maximum number of dialout attempts (default: 5)
+        base_delay: Delay in seconds before the first retry, doubled on each retry (default: 0.25)
+        max_delay: Upper bound in seconds for the retry delay (default: 8.0)
     """
 
     def __init__(
@@ -53,19 +59,24 @@ class DialoutManager:
         transport: BaseTransport,
         dialout_settings: DialoutSettings,
         max_retries: Optional[int] = 5,
+        base_delay: float = 0.25,
+        max_delay: float = 8.0,
     ):
         self._transport = transport
         self._phone_number = dialout_settings.phone_number
         self._caller_id = dialout_settings.caller_id
         self._max_retries = max_retries
+        self._base_delay = base_delay
+        self._max_delay = max_delay
         self._attempt_count = 0
-        self._is_successful = False
+        self._successful = asyncio.Event()
 
     async def attempt_dialout(self) -> bool:
         """Attempt to start a dialout call.
 
         Initiates an outbound call if retry limit hasn't been reached and
-        no successful connection has been made yet.
+        no successful connection has been made yet. Retries wait for an
+        exponentially increasing, jittered delay before dialing.
 
         Returns:
             True if dialout attempt was initiated, False if max retries reached
@@ -77,10 +88,22 @@ class DialoutManager:
             )
             return False
 
-        if self._is_successful:
+        if self._successful.is_set():
             logger.debug("Dialout already successful, skipping attempt")
             return False
 
+        if self._attempt_count > 0:
+            delay = min(self._base_delay * (2 ** (self._attempt_count - 1)), self._max_delay)
+            delay += random.uniform(0, 0.1)
+            logger.debug(f"Waiting {delay:.2f}s before retrying dialout")
+            try:
+                # Wake up early if the call is answered while we're backing off
+                await asyncio.wait_for(self._successful.wait(), timeout=delay)
+                logger.debug("Dialout succeeded while waiting, skipping retry")
+                return False
+            except asyncio.TimeoutError:
+                pass
+
         self._attempt_count += 1
         logger.info(
             f"Attempting dialout (attempt {self._attempt_count}/{self._max_retries}) to: {self._phone_number}"
@@ -97,7 +120,7 @@ class DialoutManager:
 
     def mark_successful(self):
         """Mark the dialout as successful to prevent further retry attempts."""
-        self._is_successful = True
+        self._successful.set()
 
     def should_retry(self) -> bool:
         """Check if another dialout attempt should be made.
@@ -105,7 +128,7 @@ class DialoutManager:
         Returns:
             True if retry limit not reached and call not yet successful
         """
-        return self._attempt_count < self._max_retries and not self._is_successful
+        return self._attempt_count < self._max_retries and not self._successful.is_set()
 
 
 async def run_bot(
@@ -35,6 +35,7 @@ from server_utils import (
     start_bot_local,
     start_bot_production,
     twilio_call_data_from_request,
+    validate_twilio_signature,
 )
 
 load_dotenv()
@@ -46,7 +47,23 @@ async def lifespan(app: FastAPI):
 
     Creates a shared aiohttp session for making HTTP requests to bot endpoints.
     The session is reused across requests for better performance through connection pooling.
+    Twilio webhook signature validation is opt-in: it's enabled by setting
+    TWILIO_WEBHOOK_URL to the public URL configured in Twilio. The auth token is
+    read and encoded once so signature checks don't repeat that work on every call.
     """
+    app.state.twilio_webhook_url = os.getenv("TWILIO_WEBHOOK_URL")
+    app.state.twilio_auth_token = None
+    if app.state.twilio_webhook_url:
+        twilio_auth_token = os.getenv("TWILIO_AUTH_TOKEN")
+        if twilio_auth_token:
+            app.state.twilio_auth_token = twilio_auth_token.encode()
+            logger.info("Validating Twilio webhook signatures")
+        else:
+            logger.warning(
+                "TWILIO_WEBHOOK_URL is set but TWILIO_AUTH_TOKEN isn't, "
+                "Twilio webhook signatures won't be validated"
+            )
+
     # Create shared HTTP session for bot API calls
     app.state.http_session = aiohttp.ClientSession()
     logger.info("Created shared HTTP session")
@@ -65,7 +82,7 @@ async def handle_call(request: Request):
     Handle incoming Twilio call webhook.
 
     This endpoint:
-    1. Receives Twilio webhook data for incoming calls
+    1. Receives Twilio webhook data for incoming calls and, if enabled, validates its signature
     2. Creates a Daily room with SIP capabilities
     3. Starts the bot (locally or via Pipecat Cloud based on ENV)
     4. Returns TwiML to put caller on hold while bot connects
@@ -76,6 +93,11 @@ async def handle_call(request: Request):
     """
     logger.debug("Received call webhook from Twilio")
 
+    if request.app.state.twilio_auth_token:
+        await validate_twilio_signature(
+            request, request.app.state.twilio_auth_token, request.app.state.twilio_webhook_url
+        )
+
     call_data = await twilio_call_data_from_request(request)
 
     sip_config = await create_daily_room(
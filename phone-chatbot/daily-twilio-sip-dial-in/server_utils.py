@@ -4,18 +4,42 @@
 # SPDX-License-Identifier: BSD 2-Clause License
 #
 
+import base64
+import hashlib
+import hmac
 import os
+from dataclasses import dataclass
+from functools import cache
 
 import aiohttp
 from fastapi import HTTPException, Request
 from loguru import logger
+from multidict import CIMultiDict
 from pipecat.runner.daily import DailyRoomConfig, configure
 from pydantic import BaseModel
 
+# Headers for bot start requests are built once and reused, so aiohttp doesn't
+# have to convert a fresh dict on every call.
+_LOCAL_HEADERS = CIMultiDict({"Content-Type": "application/json"})
 
-class TwilioCallData(BaseModel):
+
+@cache
+def _cloud_headers(pipecat_api_key: str) -> CIMultiDict:
+    return CIMultiDict(
+        {
+            "Authorization": f"Bearer {pipecat_api_key}",
+            "Content-Type": "application/json",
+        }
+    )
+
+
+@dataclass(slots=True, frozen=True)
+class TwilioCallData:
     """Data received from Twilio call webhook.
 
+    Only used inside this server, so a plain dataclass is enough; validation
+    happens when the webhook form is parsed.
+
     Attributes:
         call_sid: Unique identifier for the call
         from_phone: The caller's phone number
@@ -44,6 +68,38 @@ class AgentRequest(BaseModel):
     to_phone: str
 
 
+async def validate_twilio_signature(request: Request, auth_token: bytes, webhook_url: str):
+    """Validate the X-Twilio-Signature header of an incoming webhook.
+
+    Twilio signs each request with HMAC-SHA1 over the full request URL followed
+    by every POST parameter (sorted by name) concatenated as key + value. The
+    URL is the one configured in Twilio rather than the one the server sees,
+    which differs behind ngrok or a TLS-terminating proxy.
+
+    See: https://www.twilio.com/docs/usage/security#validating-requests
+
+    Args:
+        request: Incoming Twilio webhook request
+        auth_token: Twilio auth token, already encoded to bytes
+        webhook_url: Public webhook URL exactly as configured in Twilio
+
+    Raises:
+        HTTPException: If the signature is missing or does not match
+    """
+    signature = request.headers.get("X-Twilio-Signature")
+    if not signature:
+        raise HTTPException(status_code=403, detail="Missing X-Twilio-Signature header")
+
+    form_data = await request.form()
+    canonical = webhook_url + "".join(k + v for k, v in sorted(form_data.items()))
+
+    digest = hmac.new(auth_token, canonical.encode(), hashlib.sha1).digest()
+    expected = base64.b64encode(digest)
+
+    if not hmac.compare_digest(expected, signature.encode()):
+        raise HTTPException(status_code=403, detail="Invalid Twilio signature")
+
+
 async def twilio_call_data_from_request(request: Request):
     # Get form data from Twilio webhook
     form_data = await request.form()
@@ -123,10 +179,7 @@ async def start_bot_production(agent_request: AgentRequest, session: aiohttp.Cli
 
     async with session.post(
         f"https://api.pipecat.daily.co/v1/public/{agent_name}/start",
-        headers={
-            "Authorization": f"Bearer {pipecat_api_key}",
-            "Content-Type": "application/json",
-        },
+        headers=_cloud_headers(pipecat_api_key),
         json={
             "createDailyRoom": False,  # We already created the room
             "body": body_data,
@@ -160,7 +213,7 @@ async def start_bot_local(agent_request: AgentRequest, session: aiohttp.ClientSe
 
     async with session.post(
         f"{local_server_url}/start",
-        headers={"Content-Type": "application/json"},
+        headers=_LOCAL_HEADERS,
         json={
             "createDailyRoom": False,  # We already created the room
             "body": body_data,
@@ -6,7 +6,9 @@
 
 """Daily + Twilio SIP dial-out voice bot implementation."""
 
+import asyncio
 import os
+import random
 from typing import Any, Optional
 
 from dotenv import load_dotenv
@@ -26,21 +28,36 @@ from pipecat.services.openai.llm import OpenAILLMService
 from pipecat.transports.daily.transport import DailyParams, DailyTransport
 from pipecat.workers.runner import WorkerRunner
 
-from server_utils import AgentRequest, DialoutSettings
+from server_utils import AgentRequest, DialoutSettings, extract_phone_from_sip_uri
 
 load_dotenv(override=True)
 
+DEEPGRAM_API_KEY = os.getenv("DEEPGRAM_API_KEY")
+OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
+CARTESIA_API_KEY = os.getenv("CARTESIA_API_KEY")
+
+SYSTEM_INSTRUCTION = (
+    "You are a friendly phone assistant. Your responses will be read aloud, "
+    "so keep them concise and conversational. Avoid special characters or "
+    "formatting. Begin by greeting the caller and asking how you can help them today."
+)
+CARTESIA_VOICE_ID = "71a7ad14-091c-4e8e-a314-022ece01c121"  # British Reading Lady
+
 
 class DialoutManager:
     """Manages dialout attempts with retry logic.
 
     Handles the complexity of initiating outbound calls with automatic retry
-    on failure, up to a configurable maximum number of attempts.
+    on failure, up to a configurable maximum number of attempts. Retries are
+    delayed with exponential backoff plus jitter so a failing endpoint isn't
+    hammered with back-to-back attempts.
 
     Args:
         transport: The Daily transport instance for making the dialout
         dialout_settings: Settings containing SIP URI
         max_retries: Maximum number of dialout attempts (default: 5)
+        base_delay: Delay in seconds before the first retry, doubled on each retry (default: 0.25)
+        max_delay: Upper bound in seconds for the retry delay (default: 8.0)
     """
 
     def __init__(
@@ -48,19 +65,25 @@ class DialoutManager:
         transport: DailyTransport,
         dialout_settings: DialoutSettings,
         max_retries: Optional[int] = 5,
+        base_delay: float = 0.25,
+        max_delay: float = 8.0,
     ):
         self._transport = transport
         self._sip_uri = dialout_settings.sip_uri
+        self._display_name = extract_phone_from_sip_uri(self._sip_uri) or self._sip_uri
         self._provider = dialout_settings.provider
         self._max_retries = max_retries
+        self._base_delay = base_delay
+        self._max_delay = max_delay
         self._attempt_count = 0
-        self._is_successful = False
+        self._successful = asyncio.Event()
 
     async def attempt_dialout(self) -> bool:
         """Attempt to start a dialout call.
 
         Initiates an outbound call if retry limit hasn't been reached and
-        no successful connection has been made yet.
+        no successful connection has been made yet. Retries wait for an
+        exponentially increasing, jittered delay before dialing.
 
         Returns:
             True if dialout attempt was initiated, False if max retries reached
@@ -72,21 +95,27 @@ class DialoutManager:
             )
             return False
 
-        if self._is_successful:
+        if self._successful.is_set():
             logger.debug("Dialout already successful, skipping attempt")
             return False
 
+        if self._attempt_count > 0:
+            delay = min(self._base_delay * (2 ** (self._attempt_count - 1)), self._max_delay)
+            delay += random.uniform(0, 0.1)
+            logger.debug("Waiting {:.2f}s before retrying dialout", delay)
+            try:
+                # Wake up early if the call is answered while we're backing off
+                await asyncio.wait_for(self._successful.wait(), timeout=delay)
+                logger.debug("Dialout succeeded while waiting, skipping retry")
+                return False
+            except asyncio.TimeoutError:
+                pass
+
         self._attempt_count += 1
         logger.info(
             f"Attempting dialout (attempt {self._attempt_count}/{self._max_retries}) to: {self._sip_uri}"
         )
-        sip_uri = self._sip_uri
-        display_name = sip_uri  # fallback
-        if sip_uri.startswith("sip:") and "@" in sip_uri:
-            phone_part = sip_uri[4:]  # Remove 'sip:' prefix
-            display_name = phone_part.split("@")[0]  # Get everything before '@'
-
-        params = {"sipUri": sip_uri, "displayName": display_name}
+        params = {"sipUri": self._sip_uri, "displayName": self._display_name}
         if self._provider:
             params["provider"] = self._provider
         await self._transport.start_dialout(params)
@@ -94,7 +123,7 @@ class DialoutManager:
 
     def mark_successful(self):
         """Mark the dialout as successful to prevent further retry attempts."""
-        self._is_successful = True
+        self._successful.set()
 
     def should_retry(self) -> bool:
         """Check if another dialout attempt should be made.
@@ -102,7 +131,25 @@ class DialoutManager:
         Returns:
             True if retry limit not reached and call not yet successful
         """
-        return self._attempt_count < self._max_retries and not self._is_successful
+        return self._attempt_count < self._max_retries and not self._successful.is_set()
+
+
+def create_services() -> tuple[DeepgramSTTService, OpenAILLMService, CartesiaTTSService]:
+    """Create the STT, LLM and TTS services for a call.
+
+    Services are frame processors that hold per-pipeline state, so each call
+    needs its own instances. Only the configuration above is shared.
+    """
+    stt = DeepgramSTTService(api_key=DEEPGRAM_API_KEY)
+    llm = OpenAILLMService(
+        api_key=OPENAI_API_KEY,
+        settings=OpenAILLMService.Settings(system_instruction=SYSTEM_INSTRUCTION),
+    )
+    tts = CartesiaTTSService(
+        api_key=CARTESIA_API_KEY,
+        settings=CartesiaTTSService.Settings(voice=CARTESIA_VOICE_ID),
+    )
+    return stt, llm, tts
 
 
 async def run_bot(
@@ -116,29 +163,19 @@ async def run_bot(
     """
     logger.info(f"Starting dial-out bot, dialing out to: {dialout_settings.sip_uri}")
 
-    stt = DeepgramSTTService(api_key=os.getenv("DEEPGRAM_API_KEY"))
-    llm = OpenAILLMService(
-        api_key=os.getenv("OPENAI_API_KEY"),
-        settings=OpenAILLMService.Settings(
-            system_instruction=(
-                "You are a friendly phone assistant. Your responses will be read aloud, "
-                "so keep them concise and conversational. Avoid special characters or "
-                "formatting. Begin by greeting the caller and asking how you can help them today."
-            ),
-        ),
-    )
-    tts = CartesiaTTSService(
-        api_key=os.getenv("CARTESIA_API_KEY"),
-        settings=CartesiaTTSService.Settings(
-            voice="71a7ad14-091c-4e8e-a314-022ece01c121",  # British Reading Lady
-        ),
-    )
+    # Loading the Silero ONNX model is blocking work, so do it in a worker thread
+    # while the services are being created instead of stalling the event loop.
+    # Analyzers can't be shared between calls: each one is cleaned up when its
+    # pipeline ends.
+    vad_analyzer_task = asyncio.create_task(asyncio.to_thread(SileroVADAnalyzer))
+
+    stt, llm, tts = create_services()
 
     context = LLMContext()
     user_aggregator, assistant_aggregator = LLMContextAggregatorPair(
         context,
         user_params=LLMUserAggregatorParams(
-            vad_analyzer=SileroVADAnalyzer(),
+            vad_analyzer=await vad_analyzer_task,
         ),
     )
 
@@ -175,25 +212,25 @@ async def run_bot(
 
     @transport.event_handler("on_dialout_answered")
     async def on_dialout_answered(transport, data):
-        logger.debug(f"Dial-out answered: {data}")
+        logger.debug("Dial-out answered: {}", data)
         dialout_manager.mark_successful()
 
     @transport.event_handler("on_dialout_connected")
     async def on_dialout_connected(transport, data):
-        logger.debug(f"Dial-out connected: {data}")
+        logger.debug("Dial-out connected: {}", data)
 
     @transport.event_handler("on_dialout_stopped")
     async def on_dialout_stopped(transport, data):
-        logger.debug(f"Dial-out stopped: {data}")
+        logger.debug("Dial-out stopped: {}", data)
         await worker.cancel()
 
     @transport.event_handler("on_dialout_warning")
     async def on_dialout_warning(transport, data):
-        logger.debug(f"Dial-out warning: {data}")
+        logger.debug("Dial-out warning: {}", data)
 
     @transport.event_handler("on_dtmf_event")
     async def on_dtmf_event(transport, data):
-        logger.info(f"DTMF event: {data}")
+        logger.info("DTMF event: {}", data)
         # Echo back the DTMF tone to the caller
         # await transport._client.send_dtmf(
         #     {"sessionId": data["sessionId"], "tones": data["tone"], "digitDurationMs": 100}
@@ -206,12 +243,12 @@ async def run_bot(
         if dialout_manager.should_retry():
             await dialout_manager.attempt_dialout()
         else:
-            logger.error(f"No more retries allowed, stopping bot.")
+            logger.error("No more retries allowed, stopping bot.")
             await worker.cancel()
 
     @transport.event_handler("on_client_disconnected")
     async def on_client_disconnected(transport, client):
-        logger.info(f"Client disconnected")
+        logger.info("Client disconnected")
         await worker.cancel()
 
     runner = WorkerRunner(handle_sigint=handle_sigint)
@@ -19,6 +19,7 @@ All call data (room_url, token, dialout_settings) flows through the body paramet
 to ensure consistency between local and cloud deployments.
 """
 
+import asyncio
 import os
 from contextlib import asynccontextmanager
 
@@ -26,7 +27,7 @@ import aiohttp
 import uvicorn
 from dotenv import load_dotenv
 from fastapi import FastAPI, HTTPException, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from loguru import logger
 
 from server_utils import (
@@ -39,28 +40,54 @@ from server_utils import (
 
 load_dotenv()
 
+IS_PRODUCTION = os.getenv("ENV") == "production"
+
+
+async def _prewarm_connections(session: aiohttp.ClientSession):
+    """Open keep-alive connections to the APIs used on every dial-out request."""
+    urls = ["https://api.daily.co"]
+    if IS_PRODUCTION:
+        urls.append("https://api.pipecat.daily.co")
+
+    for url in urls:
+        try:
+            async with session.head(url):
+                pass
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logger.warning(f"Unable to pre-warm connection to {url}: {e}")
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Manage application lifecycle and shared resources.
 
     Creates a shared aiohttp session for making HTTP requests to bot endpoints.
-    The session is reused across requests for better performance through connection pooling.
+    The session is reused across requests for better performance through connection pooling,
+    and its pool is warmed up at startup so the first call doesn't pay for TLS handshakes.
     """
     # Create shared HTTP session for bot API calls
-    app.state.http_session = aiohttp.ClientSession()
+    app.state.http_session = aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(
+            limit=100,
+            limit_per_host=32,
+            ttl_dns_cache=300,
+            keepalive_timeout=75,
+        ),
+        timeout=aiohttp.ClientTimeout(total=10, connect=2),
+    )
     logger.info("Created shared HTTP session")
+    await _prewarm_connections(app.state.http_session)
     yield
     # Clean up: close the session on shutdown
     await app.state.http_session.close()
     logger.info("Closed shared HTTP session")
 
 
-app = FastAPI(lifespan=lifespan)
+app = FastAPI(lifespan=lifespan, default_response_class=ORJSONResponse)
 
 
 @app.post("/dialout")
-async def handle_dialout_request(request: Request) -> JSONResponse:
+async def handle_dialout_request(request: Request) -> ORJSONResponse:
     """Handle dial-out request.
 
     This endpoint:
@@ -70,7 +97,7 @@ async def handle_dialout_request(request: Request) -> JSONResponse:
     4. Returns room details for the client
 
     Returns:
-        JSONResponse with room_url and token
+        ORJSONResponse with room_url and token
     """
     logger.debug("Received dial-out request")
 
@@ -85,7 +112,7 @@ async def handle_dialout_request(request: Request) -> JSONResponse:
     )
 
     try:
-        if os.getenv("ENV") == "production":
+        if IS_PRODUCTION:
             await start_bot_production(agent_request, request.app.state.http_session)
         else:
             await start_bot_local(agent_request, request.app.state.http_session)
@@ -93,7 +120,7 @@ async def handle_dialout_request(request: Request) -> JSONResponse:
         logger.error(f"Error starting bot: {e}")
         raise HTTPException(status_code=500, detail=f"Failed to start bot: {str(e)}")
 
-    return JSONResponse(
+    return ORJSONResponse(
         {
             "status": "success",
             "room_url": daily_room_config.room_url,
@@ -114,7 +141,28 @@ async def health_check():
 
 
 if __name__ == "__main__":
+    # uvloop isn't available on Windows, so fall back to the asyncio loop there
+    try:
+        import uvloop  # noqa: F401
+
+        loop = "uvloop"
+    except ImportError:
+        loop = "asyncio"
+
+    # Auto-reload for local development. In production, run one worker process per
+    # core; each worker gets its own HTTP session from the lifespan handler.
+    reload = not IS_PRODUCTION
+    workers = 1 if reload else int(os.getenv("WORKERS", os.cpu_count() or 1))
+
     # Run the server
     port = int(os.getenv("PORT", "8080"))
-    logger.info(f"Starting server on port {port}")
-    uvicorn.run("server:app", host="0.0.0.0", port=port, reload=True)
+    logger.info(f"Starting server on port {port} ({workers} worker(s), {loop} event loop)")
+    uvicorn.run(
+        "server:app",
+        host="0.0.0.0",
+        port=port,
+        reload=reload,
+        workers=workers,
+        loop=loop,
+        http="httptools",
+    )
@@ -15,10 +15,31 @@ This module provides data models and functions for:
 import os
 
 import aiohttp
+import orjson
+from dotenv import load_dotenv
 from fastapi import HTTPException, Request
 from loguru import logger
+from multidict import CIMultiDict
 from pipecat.runner.daily import DailyRoomConfig, configure
-from pydantic import BaseModel
+from pydantic import BaseModel, ValidationError
+
+load_dotenv()
+
+# Read the bot start configuration once at import instead of on every request
+PIPECAT_API_KEY = os.getenv("PIPECAT_API_KEY")
+PIPECAT_AGENT_NAME = os.getenv("PIPECAT_AGENT_NAME")
+LOCAL_SERVER_URL = os.getenv("LOCAL_SERVER_URL", "http://localhost:7860")
+
+# Bot start URLs and headers don't change between requests, so build them once
+PIPECAT_START_URL = f"https://api.pipecat.daily.co/v1/public/{PIPECAT_AGENT_NAME}/start"
+PIPECAT_HEADERS = CIMultiDict(
+    {
+        "Authorization": f"Bearer {PIPECAT_API_KEY}",
+        "Content-Type": "application/json",
+    }
+)
+LOCAL_START_URL = f"{LOCAL_SERVER_URL}/start"
+LOCAL_HEADERS = CIMultiDict({"Content-Type": "application/json"})
 
 
 class DialoutSettings(BaseModel):
@@ -62,9 +83,28 @@ class AgentRequest(BaseModel):
     # Include any custom data here needed for the agent
 
 
+def extract_phone_from_sip_uri(sip_uri: str) -> str | None:
+    """Extract the user part (usually a phone number) from a SIP URI.
+
+    Args:
+        sip_uri: SIP URI in the form "sip:user@host"
+
+    Returns:
+        The user part of the URI, or None if the URI isn't a valid SIP URI
+    """
+    scheme, sep, rest = sip_uri.partition(":")
+    if scheme != "sip" or not sep:
+        return None
+    user, sep, _ = rest.partition("@")
+    return user if sep and user else None
+
+
 async def dialout_request_from_request(request: Request) -> DialoutRequest:
     """Parse and validate dial-out request data.
 
+    The raw body is decoded and validated in a single pass by pydantic-core,
+    without building an intermediate dict.
+
     Args:
         request: FastAPI request object containing dial-out data
 
@@ -72,18 +112,11 @@ async def dialout_request_from_request(request: Request) -> DialoutRequest:
         DialoutRequest: Parsed and validated dial-out request
 
     Raises:
-        HTTPException: If required fields are missing from the request data
+        HTTPException: If the body isn't valid JSON or required fields are missing
     """
-    data = await request.json()
-
-    if not data.get("dialout_settings"):
-        raise HTTPException(
-            status_code=400, detail="Missing 'dialout_settings' in the request body"
-        )
-
     try:
-        return DialoutRequest.model_validate(data)
-    except Exception as e:
+        return DialoutRequest.model_validate_json(await request.body())
+    except ValidationError as e:
         raise HTTPException(status_code=400, detail=f"Invalid request data: {str(e)}")
 
 
@@ -104,7 +137,7 @@ async def create_daily_room(
     """
     sip_uri = dialout_request.dialout_settings.sip_uri
 
-    if not (sip_uri.startswith("sip:") and "@" in sip_uri):
+    if not extract_phone_from_sip_uri(sip_uri):
         raise HTTPException(status_code=400, detail="Invalid SIP URI")
 
     try:
@@ -128,10 +161,7 @@ async def start_bot_production(agent_request: AgentRequest, session: aiohttp.Cli
     Raises:
         HTTPException: If required environment variables are missing or API call fails
     """
-    pipecat_api_key = os.getenv("PIPECAT_API_KEY")
-    agent_name = os.getenv("PIPECAT_AGENT_NAME")
-
-    if not pipecat_api_key or not agent_name:
+    if not PIPECAT_API_KEY or not PIPECAT_AGENT_NAME:
         raise HTTPException(
             status_code=500,
             detail="PIPECAT_API_KEY and PIPECAT_AGENT_NAME required for production mode",
@@ -144,15 +174,14 @@ async def start_bot_production(agent_request: AgentRequest, session: aiohttp.Cli
     body_data = agent_request.model_dump(exclude_none=True)
 
     async with session.post(
-        f"https://api.pipecat.daily.co/v1/public/{agent_name}/start",
-        headers={
-            "Authorization": f"Bearer {pipecat_api_key}",
-            "Content-Type": "application/json",
-        },
-        json={
-            "createDailyRoom": False,  # We already created the room
-            "body": body_data,
-        },
+        PIPECAT_START_URL,
+        headers=PIPECAT_HEADERS,
+        data=orjson.dumps(
+            {
+                "createDailyRoom": False,  # We already created the room
+                "body": body_data,
+            }
+        ),
     ) as response:
         if response.status != 200:
             error_text = await response.text()
@@ -173,8 +202,6 @@ async def start_bot_local(agent_request: AgentRequest, session: aiohttp.ClientSe
     Raises:
         HTTPException: If LOCAL_SERVER_URL is not set or API call fails
     """
-    local_server_url = os.getenv("LOCAL_SERVER_URL", "http://localhost:7860")
-
     logger.debug(
         f"Starting bot via local /start endpoint for dial-out to {agent_request.dialout_settings.sip_uri}"
     )
@@ -182,12 +209,14 @@ async def start_bot_local(agent_request: AgentRequest, session: aiohttp.ClientSe
     body_data = agent_request.model_dump(exclude_none=True)
 
     async with session.post(
-        f"{local_server_url}/start",
-        headers={"Content-Type": "application/json"},
-        json={
-            "createDailyRoom": False,  # We already created the room
-            "body": body_data,
-        },
+        LOCAL_START_URL,
+        headers=LOCAL_HEADERS,
+        data=orjson.dumps(
+            {
+                "createDailyRoom": False,  # We already created the room
+                "body": body_data,
+            }
+        ),
     ) as response:
         if response.status != 200:
             error_text = await response.text()
@@ -104,6 +104,10 @@ async def bot(runner_args: RunnerArguments):
         "plivo": lambda: FastAPIWebsocketParams(
             audio_in_enabled=True,
             audio_out_enabled=True,
+            # Send 80ms of audio per media message instead of the default 40ms.
+            # Each Plivo message wraps its audio in JSON and WebSocket framing,
+            # so bigger chunks halve that per-message overhead.
+            audio_out_10ms_chunks=8,
         ),
     }
 
@@ -7,68 +7,135 @@
 """An example server for Plivo to start WebSocket streaming to Pipecat Cloud."""
 
 import base64
-import json
 import os
+import secrets
+import sys
+import time
+import urllib.parse
+from collections import OrderedDict
 
+import orjson
 import uvicorn
 from dotenv import load_dotenv
 from fastapi import FastAPI, HTTPException, Query, Request, WebSocket
+from loguru import logger
+from pipecat.runner.types import WebSocketRunnerArguments
 from starlette.responses import Response
 
+# Import the bot at startup so its heavy dependencies (Silero VAD, service SDKs)
+# are loaded before the first call connects, not while it's waiting for audio.
+from bot import bot
+
 # Load environment variables from .env file
 load_dotenv()
 
+# Write logs from a background thread so log I/O never blocks a request handler.
+# remove() drops every sink, so this is safe if the module is imported twice.
+logger.remove()
+logger.add(sys.stderr, level="DEBUG", enqueue=True)
+
+# Read the deployment configuration once at startup instead of on every webhook
+ENV = os.getenv("ENV", "local").lower()
+AGENT_NAME = os.getenv("AGENT_NAME")
+ORGANIZATION_NAME = os.getenv("ORGANIZATION_NAME")
+
+if ENV == "production":
+    if not AGENT_NAME or not ORGANIZATION_NAME:
+        raise ValueError(
+            "AGENT_NAME and ORGANIZATION_NAME must be set in environment variables for production"
+        )
+    logger.warning("If deployed in a region other than us-west (default), update websocket url!")
+
+PRODUCTION_WS_URL = "wss://api.pipecat.daily.co/ws/plivo"
+# uncomment appropriate region url:
+# PRODUCTION_WS_URL = "wss://us-east.api.pipecat.daily.co/ws/plivo"
+# PRODUCTION_WS_URL = "wss://eu-central.api.pipecat.daily.co/ws/plivo"
+# PRODUCTION_WS_URL = "wss://ap-south.api.pipecat.daily.co/ws/plivo"
+SERVICE_HOST_PARAM = f"serviceHost={AGENT_NAME}.{ORGANIZATION_NAME}"
+
 app = FastAPI(title="Plivo XML Server", description="Serves XML for Plivo WebSocket streaming")
 
+# Plivo XML response, built once. Only the WebSocket URL changes per call.
+# Query parameters are passed in the URL, so no extraHeaders attribute is needed.
+_STREAM_XML_TEMPLATE = b"""<?xml version="1.0" encoding="UTF-8"?>
+<Response>
+  <Stream bidirectional="true" keepCallAlive="true" contentType="audio/x-mulaw;rate=8000">
+    %b
+  </Stream>
+</Response>"""
 
-def get_websocket_url(host: str, body_data: dict = None):
-    """Construct WebSocket URL based on environment variables with query parameters."""
-    env = os.getenv("ENV", "local").lower()
-
-    # Build query parameters
-    query_params = []
-
-    if env == "production":
-        agent_name = os.getenv("AGENT_NAME")
-        org_name = os.getenv("ORGANIZATION_NAME")
-
-        if not agent_name or not org_name:
-            raise ValueError(
-                "AGENT_NAME and ORGANIZATION_NAME must be set in environment variables for production"
-            )
-
-        service_host = f"{agent_name}.{org_name}"
-        query_params.append(f"serviceHost={service_host}")
-        print("If deployed in a region other than us-west (default), update websocket url!")
-        base_url = "wss://api.pipecat.daily.co/ws/plivo"
-        # uncomment appropriate region url:
-        # base_url = wss://us-east.api.pipecat.daily.co/ws/plivo
-        # base_url = wss://eu-central.api.pipecat.daily.co/ws/plivo
-        # base_url = wss://ap-south.api.pipecat.daily.co/ws/plivo
-    else:
-        base_url = f"wss://{host}/ws"
+# Call data for local WebSocket connections, keyed by a short random token. Only
+# the token goes in the WebSocket URL, so the URL stays small, and the data is
+# handed to the bot as its runner body.
+CALL_BODY_TTL_SECS = 300
+CALL_BODY_MAX_ENTRIES = 4096
+_call_bodies: OrderedDict[str, tuple[float, dict]] = OrderedDict()
 
-    # Add body data as query parameter
-    if body_data:
-        body_json = json.dumps(body_data)
-        body_encoded = base64.b64encode(body_json.encode("utf-8")).decode("utf-8")
-        query_params.append(f"body={body_encoded}")
 
-    # Construct final URL
-    if query_params:
-        return f"{base_url}?{'&amp;'.join(query_params)}"
-    else:
-        return base_url
+def store_call_body(body_data: dict) -> str:
+    """Store call data for an upcoming local WebSocket connection and return its token."""
+    now = time.monotonic()
 
+    # Entries are in insertion order, so expired ones are always at the front
+    while _call_bodies:
+        token, (expires_at, _) = next(iter(_call_bodies.items()))
+        if expires_at > now and len(_call_bodies) < CALL_BODY_MAX_ENTRIES:
+            break
+        del _call_bodies[token]
 
-@app.get("/")
-async def start_call(
-    request: Request,
-    # Optional Plivo parameters that are automatically passed by Plivo
-    CallUUID: str = Query(None, description="Plivo call UUID"),
-    From: str = Query(None, description="Caller's phone number"),
-    To: str = Query(None, description="Called phone number"),
-):
+    token = secrets.token_urlsafe(16)
+    _call_bodies[token] = (now + CALL_BODY_TTL_SECS, body_data)
+    return token
+
+
+def get_call_body(token: str) -> dict | None:
+    """Take the call data for a token. Returns None for unknown, used or expired tokens.
+
+    Each token is good for a single WebSocket connection, so it's removed on use.
+    """
+    entry = _call_bodies.pop(token, None)
+    if not entry or entry[0] <= time.monotonic():
+        return None
+    return entry[1]
+
+
+def get_websocket_url(host: str, body_data: dict = None):
+    """Construct WebSocket URL based on environment variables with query parameters."""
+    if ENV == "production":
+        url = f"{PRODUCTION_WS_URL}?{SERVICE_HOST_PARAM}"
+        # Pipecat Cloud receives the body data as a standard base64 query
+        # parameter. Its "+", "/" and "=" must be percent-encoded.
+        if body_data:
+            body_encoded = base64.b64encode(orjson.dumps(body_data))
+            query = urllib.parse.urlencode({"body": body_encoded})
+            url = f"{url}&amp;{query}"  # The URL is embedded in XML
+        return url
+
+    # Our own /ws endpoint looks the body data up by token
+    token = store_call_body(body_data or {})
+    return f"wss://{host}/ws?k={token}"
+
+
+# Optional Plivo parameters that are automatically passed by Plivo. They're read
+# straight from the query string and only declared here for the OpenAPI docs.
+_PLIVO_QUERY_PARAMS = [
+    {
+        "name": name,
+        "in": "query",
+        "required": False,
+        "schema": {"type": "string"},
+        "description": description,
+    }
+    for name, description in [
+        ("CallUUID", "Plivo call UUID"),
+        ("From", "Caller's phone number"),
+        ("To", "Called phone number"),
+    ]
+]
+
+
+@app.get("/", openapi_extra={"parameters": _PLIVO_QUERY_PARAMS})
+async def start_call(request: Request):
     """
     Returns XML for Plivo to start WebSocket streaming with call information
 
@@ -84,7 +151,12 @@ async def start_call(
 
     Example webhook URL: https://your-domain.com/
     """
-    print("GET Plivo XML")
+    logger.info("GET Plivo XML")
+
+    query_params = request.query_params
+    CallUUID = query_params.get("CallUUID")
+    From = query_params.get("From")
+    To = query_params.get("To")
 
     # Create body data with phone numbers only
     body_data = {}
@@ -97,18 +169,9 @@ async def start_call(
 
     # Log call details
     if CallUUID:
-        print(f"Plivo inbound call: {From} → {To}, UUID: {CallUUID}")
+        logger.info(f"Plivo inbound call: {From} → {To}, UUID: {CallUUID}")
         if body_data:
-            print(f"Body data: {body_data}")
-
-    # Validate environment configuration
-    env = os.getenv("ENV", "local").lower()
-    if env == "production":
-        if not os.getenv("AGENT_NAME") or not os.getenv("ORGANIZATION_NAME"):
-            raise HTTPException(
-                status_code=500,
-                detail="AGENT_NAME and ORGANIZATION_NAME must be set for production deployment",
-            )
+            logger.info(f"Body data: {body_data}")
 
     # Get request host and construct WebSocket URL with body data
     host = request.headers.get("host")
@@ -117,63 +180,68 @@ async def start_call(
 
     websocket_url = get_websocket_url(host, body_data if body_data else None)
 
-    # Build XML without extraHeaders (using query parameters instead)
-    xml = f"""<?xml version="1.0" encoding="UTF-8"?>
-<Response>
-  <Stream bidirectional="true" keepCallAlive="true" contentType="audio/x-mulaw;rate=8000">
-    {websocket_url}
-  </Stream>
-</Response>"""
-    print(f"Generated XML: {xml}")
-    return Response(content=xml, media_type="application/xml")
+    xml = _STREAM_XML_TEMPLATE % websocket_url.encode()
+    logger.info(f"Generated XML: {xml.decode()}")
+    # Starlette sets Content-Length from the bytes body, so the response is never chunked.
+    # The XML embeds a per-call token, so it must not be cached.
+    return Response(
+        content=xml, media_type="application/xml", headers={"Cache-Control": "no-store"}
+    )
 
 
 @app.websocket("/ws")
-async def websocket_endpoint(
-    websocket: WebSocket,
-    body: str = Query(None),
-    serviceHost: str = Query(None),
-):
+async def websocket_endpoint(websocket: WebSocket, k: str = Query(None)):
     """Handle WebSocket connections for inbound calls."""
-    await websocket.accept()
-    print("WebSocket connection accepted for inbound call")
-
-    print(f"Received query params - body: {body}, serviceHost: {serviceHost}")
+    body_data = get_call_body(k) if k else None
+    if body_data is None:
+        # Stream reconnects and direct connections have no call data, but can
+        # still run the bot
+        logger.warning("WebSocket connection has a missing or unknown call token, no call data")
+        body_data = {}
 
-    # Decode body parameter if provided
-    body_data = {}
-    if body:
-        try:
-            # Base64 decode the JSON (it was base64-encoded in the webhook handler)
-            decoded_json = base64.b64decode(body).decode("utf-8")
-            body_data = json.loads(decoded_json)
-            print(f"Decoded body data: {body_data}")
-        except Exception as e:
-            print(f"Error decoding body parameter: {e}")
-    else:
-        print("No body parameter received")
+    await websocket.accept()
+    logger.info("WebSocket connection accepted for inbound call")
+    logger.info(f"Call body data: {body_data}")
 
     try:
-        # Import the bot function from the bot module
-        from pipecat.runner.types import WebSocketRunnerArguments
-
-        from bot import bot
-
         # Create runner arguments and run the bot
-        runner_args = WebSocketRunnerArguments(websocket=websocket)
+        runner_args = WebSocketRunnerArguments(websocket=websocket, body=body_data)
         runner_args.handle_sigint = False
 
-        # TODO: When WebSocketRunnerArguments supports body, add it here:
-        # runner_args = WebSocketRunnerArguments(websocket=websocket, body=body_data)
-
         await bot(runner_args)
 
     except Exception as e:
-        print(f"Error in WebSocket endpoint: {e}")
+        logger.error(f"Error in WebSocket endpoint: {e}")
         await websocket.close()
 
 
 if __name__ == "__main__":
+    # uvloop isn't available on Windows, so fall back to the asyncio loop there
+    try:
+        import uvloop  # noqa: F401
+
+        loop = "uvloop"
+    except ImportError:
+        loop = "asyncio"
+
+    # In production this server only returns XML, so it can scale across worker
+    # processes that share the listening socket. Locally, /ws runs the bot and looks up
+    # call data stored by the webhook, so both must happen in the same process.
+    if ENV == "production":
+        workers = int(os.getenv("WORKERS", os.cpu_count() or 1))
+    else:
+        workers = 1
+
     # Run the server on port 7860
     # Use with ngrok: ngrok http 7860
-    uvicorn.run(app, host="0.0.0.0", port=7860)
+    # Audio arrives as many small base64 μ-law messages that barely compress, so skip
+    # per-message deflate and save the per-frame compression work.
+    uvicorn.run(
+        "server:app",
+        host="0.0.0.0",
+        port=7860,
+        workers=workers,
+        loop=loop,
+        http="httptools",
+        ws_per_message_deflate=False,
+    )
@@ -10,42 +10,83 @@ Webhook server to handle outbound call requests, initiate calls via Plivo API,
 and handle subsequent WebSocket connections for Media Streams.
 """
 
-import base64
-import json
 import os
+import re
+import sys
 import urllib.parse
 from contextlib import asynccontextmanager
+from functools import lru_cache
 
 import aiohttp
+import orjson
+import pybase64
 import uvicorn
 from dotenv import load_dotenv
-from fastapi import FastAPI, HTTPException, Query, Request, WebSocket
+from fastapi import Body, FastAPI, HTTPException, Query, Request, WebSocket
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi.responses import JSONResponse, Response
+from loguru import logger
+from pipecat.runner.types import WebSocketRunnerArguments
+
+# Import the bot at startup so its heavy dependencies (Silero VAD, service SDKs)
+# are loaded before the first call connects, not while it's waiting for audio.
+from bot import bot
 
 load_dotenv(override=True)
 
+# Write logs from a background thread so log I/O never blocks a request handler.
+# remove() drops every sink, so this is safe if the module is imported twice.
+logger.remove()
+logger.add(sys.stderr, level="DEBUG", enqueue=True)
+
+# Read the deployment environment once at startup instead of on every webhook
+ENV = os.getenv("ENV", "local").lower()
+SERVICE_HOST_PARAM = f"serviceHost={os.getenv('AGENT_NAME')}.{os.getenv('ORGANIZATION_NAME')}"
+
+# Plivo credentials are fixed for the life of the process, so validate them and
+# build the API URL and auth once at startup
+PLIVO_AUTH_ID = os.getenv("PLIVO_AUTH_ID")
+PLIVO_AUTH_TOKEN = os.getenv("PLIVO_AUTH_TOKEN")
+PLIVO_PHONE_NUMBER = os.getenv("PLIVO_PHONE_NUMBER")
+
+if not PLIVO_AUTH_ID:
+    raise ValueError("Missing Plivo Auth ID (PLIVO_AUTH_ID)")
+
+if not PLIVO_AUTH_TOKEN:
+    raise ValueError("Missing Plivo Auth Token (PLIVO_AUTH_TOKEN)")
+
+if not PLIVO_PHONE_NUMBER:
+    raise ValueError("Missing Plivo phone number (PLIVO_PHONE_NUMBER)")
+
+PLIVO_CALL_URL = f"https://api.plivo.com/v1/Account/{PLIVO_AUTH_ID}/Call/"
+PLIVO_AUTH = aiohttp.BasicAuth(PLIVO_AUTH_ID, PLIVO_AUTH_TOKEN)
+
+# E.164 phone numbers, with or without the leading "+"
+PHONE_NUMBER_RE = re.compile(r"\+?[1-9]\d{6,14}")
+
+# Plivo answer XML, built once. Only the WebSocket URL changes per call. It's
+# kept compact since Plivo doesn't need it pretty-printed.
+_ANSWER_XML_TEMPLATE = (
+    b'<?xml version="1.0" encoding="UTF-8"?>'
+    b"<Response>"
+    b'<Stream bidirectional="true" keepCallAlive="true" contentType="audio/x-mulaw;rate=8000">'
+    b"%b"
+    b"</Stream>"
+    b"</Response>"
+)
+
 
 # ----------------- HELPERS ----------------- #
 
 
+class PlivoCallError(Exception):
+    """Raised when the Plivo API doesn't accept an outbound call request."""
+
+
 async def make_plivo_call(
     session: aiohttp.ClientSession, to_number: str, from_number: str, answer_url: str
 ):
     """Make an outbound call using Plivo's REST API."""
-    auth_id = os.getenv("PLIVO_AUTH_ID")
-    auth_token = os.getenv("PLIVO_AUTH_TOKEN")
-
-    if not auth_id:
-        raise ValueError("Missing Plivo Auth ID (PLIVO_AUTH_ID)")
-
-    if not auth_token:
-        raise ValueError("Missing Plivo Auth Token (PLIVO_AUTH_TOKEN)")
-
-    headers = {
-        "Content-Type": "application/json",
-    }
-
     data = {
         "to": to_number,
         "from": from_number,
@@ -53,43 +94,71 @@ async def make_plivo_call(
         "answer_method": "GET",
     }
 
-    url = f"https://api.plivo.com/v1/Account/{auth_id}/Call/"
-
-    # Use HTTP Basic Auth
-    auth = aiohttp.BasicAuth(auth_id, auth_token)
-
-    async with session.post(url, headers=headers, json=data, auth=auth) as response:
+    # json= sets the application/json Content-Type header
+    async with session.post(PLIVO_CALL_URL, json=data, auth=PLIVO_AUTH) as response:
         if response.status != 201:
             error_text = await response.text()
-            raise Exception(f"Plivo API error ({response.status}): {error_text}")
+            raise PlivoCallError(f"Plivo API error ({response.status}): {error_text}")
 
         result = await response.json()
         return result
 
 
-def get_websocket_url(host: str):
-    """Construct WebSocket URL based on environment variables."""
-    env = os.getenv("ENV", "local").lower()
+@lru_cache(maxsize=16)
+def get_websocket_url(host: str) -> str:
+    """Construct WebSocket URL based on environment variables.
 
-    if env == "production":
-        print("If deployed in a region other than us-west (default), update websocket url!")
+    The environment is fixed at startup and a server only sees a handful of
+    hosts, so the URL is cached per host.
+    """
+    if ENV == "production":
+        logger.warning(
+            "If deployed in a region other than us-west (default), update websocket url!"
+        )
         ws_url = "wss://api.pipecat.daily.co/ws/plivo"
         # uncomment appropriate region url:
         # ws_url = wss://us-east.api.pipecat.daily.co/ws/plivo
         # ws_url = wss://eu-central.api.pipecat.daily.co/ws/plivo
         # ws_url = wss://ap-south.api.pipecat.daily.co/ws/plivo
-        return ws_url
+        return f"{ws_url}?{SERVICE_HOST_PARAM}"
     else:
         return f"wss://{host}/ws"
 
 
+@lru_cache(maxsize=16)
+def get_answer_xml_without_body(host: str) -> bytes:
+    """Answer XML for calls without body data, which is the same for every call to a host."""
+    return _ANSWER_XML_TEMPLATE % get_websocket_url(host).encode("ascii")
+
+
+async def prewarm_plivo_connection(session: aiohttp.ClientSession):
+    """Open a keep-alive connection to the Plivo API so the first call skips the TLS handshake."""
+    try:
+        async with session.head(
+            "https://api.plivo.com/v1/", timeout=aiohttp.ClientTimeout(total=5)
+        ):
+            pass
+    except (aiohttp.ClientError, TimeoutError) as e:
+        logger.warning(f"Unable to pre-warm connection to the Plivo API: {e}")
+
+
 # ----------------- API ----------------- #
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    # Create aiohttp session for Plivo API calls
-    app.state.session = aiohttp.ClientSession()
+    # Create aiohttp session for Plivo API calls. Every request goes to the same
+    # host, so keep connections alive and pooled and cache its DNS lookup.
+    app.state.session = aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(
+            limit=200,
+            limit_per_host=100,
+            ttl_dns_cache=300,
+            keepalive_timeout=75,
+        ),
+        json_serialize=lambda obj: orjson.dumps(obj).decode(),
+    )
+    await prewarm_plivo_connection(app.state.session)
     yield
     # Close session when shutting down
     await app.state.session.close()
@@ -106,69 +175,67 @@ app.add_middleware(
 )
 
 
-@app.post("/start")
-async def initiate_outbound_call(request: Request) -> JSONResponse:
-    """Handle outbound call request and initiate call via Plivo."""
-    print("Received outbound call request")
-
-    try:
-        data = await request.json()
-
-        # Validate request data
-        if not data.get("phone_number"):
-            raise HTTPException(
-                status_code=400, detail="Missing 'phone_number' in the request body"
-            )
-
-        # Extract the phone number to dial
-        phone_number = str(data["phone_number"])
-
-        # Extract body data if provided
-        body_data = data.get("body", {})
-        print(f"Processing outbound call to {phone_number}")
-
-        # Get server URL for answer URL
-        host = request.headers.get("host")
-        if not host:
-            raise HTTPException(status_code=400, detail="Unable to determine server host")
+@app.exception_handler(PlivoCallError)
+@app.exception_handler(aiohttp.ClientError)
+@app.exception_handler(TimeoutError)
+async def plivo_call_error_handler(request: Request, exc: Exception) -> JSONResponse:
+    """Turn failed or timed out Plivo API requests into a 500 response."""
+    # Timeouts have no message, so fall back to the exception type
+    reason = str(exc) or type(exc).__name__
+    logger.error(f"Error initiating Plivo call: {reason}")
+    return JSONResponse(status_code=500, content={"detail": f"Failed to initiate call: {reason}"})
 
-        # Use https for production, http for localhost
-        protocol = (
-            "https"
-            if not host.startswith("localhost") and not host.startswith("127.0.0.1")
-            else "http"
-        )
 
-        # Add body data as query parameters to answer URL
-        answer_url = f"{protocol}://{host}/answer"
-        if body_data:
-            body_json = json.dumps(body_data)
-            body_encoded = urllib.parse.quote(body_json)
-            answer_url = f"{answer_url}?body_data={body_encoded}"
-
-        # Initiate outbound call via Plivo
-        try:
-            call_result = await make_plivo_call(
-                session=request.app.state.session,
-                to_number=phone_number,
-                from_number=os.getenv("PLIVO_PHONE_NUMBER"),
-                answer_url=answer_url,
-            )
-
-            # Extract call UUID from Plivo response
-            call_uuid = (
-                call_result.get("request_uuid") or call_result.get("message_uuid") or "unknown"
-            )
+@app.post("/start")
+async def initiate_outbound_call(request: Request, data: dict = Body(...)) -> JSONResponse:
+    """Handle outbound call request and initiate call via Plivo.
+
+    FastAPI rejects malformed JSON bodies, and Plivo API errors are turned into
+    responses by plivo_call_error_handler.
+    """
+    logger.info("Received outbound call request")
+
+    # Validate request data
+    if not data.get("phone_number"):
+        raise HTTPException(status_code=400, detail="Missing 'phone_number' in the request body")
+
+    # Extract the phone number to dial. Reject malformed numbers here instead of
+    # waiting for a round trip to the Plivo API to fail.
+    phone_number = str(data["phone_number"])
+    if not PHONE_NUMBER_RE.fullmatch(phone_number):
+        raise HTTPException(status_code=400, detail="Invalid phone number")
+
+    # Extract body data if provided
+    body_data = data.get("body", {})
+    logger.info(f"Processing outbound call to {phone_number}")
+
+    # Get server URL for answer URL
+    host = request.headers.get("host")
+    if not host:
+        raise HTTPException(status_code=400, detail="Unable to determine server host")
+
+    # Use https for production, http for localhost
+    protocol = (
+        "https" if not host.startswith("localhost") and not host.startswith("127.0.0.1") else "http"
+    )
 
-        except Exception as e:
-            print(f"Error initiating Plivo call: {e}")
-            raise HTTPException(status_code=500, detail=f"Failed to initiate call: {str(e)}")
+    # Add body data as query parameters to answer URL
+    answer_url = f"{protocol}://{host}/answer"
+    if body_data:
+        # orjson produces bytes, so percent-encode them directly
+        body_encoded = urllib.parse.quote_from_bytes(orjson.dumps(body_data), safe="")
+        answer_url = f"{answer_url}?body_data={body_encoded}"
+
+    # Initiate outbound call via Plivo
+    call_result = await make_plivo_call(
+        session=request.app.state.session,
+        to_number=phone_number,
+        from_number=PLIVO_PHONE_NUMBER,
+        answer_url=answer_url,
+    )
 
-    except HTTPException:
-        raise
-    except Exception as e:
-        print(f"Unexpected error: {str(e)}")
-        raise HTTPException(status_code=500, detail=f"Server error: {str(e)}")
+    # Extract call UUID from Plivo response
+    call_uuid = call_result.get("request_uuid") or call_result.get("message_uuid") or "unknown"
 
     return JSONResponse(
         {
@@ -179,28 +246,45 @@ async def initiate_outbound_call(request: Request) -> JSONResponse:
     )
 
 
-@app.get("/answer")
-async def get_answer_xml(
-    request: Request,
-    CallUUID: str = Query(None, description="Plivo call UUID"),
-    body_data: str = Query(None, description="JSON encoded body data"),
-) -> HTMLResponse:
+# /answer query parameters. They're read straight from the query string and
+# only declared here for the OpenAPI docs.
+_ANSWER_QUERY_PARAMS = [
+    {
+        "name": name,
+        "in": "query",
+        "required": False,
+        "schema": {"type": "string"},
+        "description": description,
+    }
+    for name, description in [
+        ("CallUUID", "Plivo call UUID"),
+        ("body_data", "JSON encoded body data"),
+    ]
+]
+
+
+@app.get("/answer", openapi_extra={"parameters": _ANSWER_QUERY_PARAMS})
+async def get_answer_xml(request: Request) -> Response:
     """Return XML instructions for connecting call to WebSocket."""
-    print("Serving answer XML for outbound call")
+    logger.info("Serving answer XML for outbound call")
+
+    query_params = request.query_params
+    CallUUID = query_params.get("CallUUID")
+    body_data = query_params.get("body_data")
 
     # Parse body data from query parameter
     parsed_body_data = {}
     if body_data:
         try:
-            parsed_body_data = json.loads(body_data)
-        except json.JSONDecodeError:
-            print(f"Failed to parse body data: {body_data}")
+            parsed_body_data = orjson.loads(body_data)
+        except orjson.JSONDecodeError:
+            logger.error(f"Failed to parse body data: {body_data}")
 
     # Log call details
     if CallUUID:
-        print(f"Plivo outbound call UUID: {CallUUID}")
+        logger.info(f"Plivo outbound call UUID: {CallUUID}")
         if parsed_body_data:
-            print(f"Body data: {parsed_body_data}")
+            logger.info(f"Body data: {parsed_body_data}")
 
     try:
         # Get the server host to construct WebSocket URL
@@ -208,44 +292,25 @@ async def get_answer_xml(
         if not host:
             raise HTTPException(status_code=400, detail="Unable to determine server host")
 
-        # Get base WebSocket URL
-        base_ws_url = get_websocket_url(host)
-
-        # Add query parameters to WebSocket URL
-        query_params = []
-
-        # Add serviceHost for production
-        env = os.getenv("ENV", "local").lower()
-        if env == "production":
-            agent_name = os.getenv("AGENT_NAME")
-            org_name = os.getenv("ORGANIZATION_NAME")
-            service_host = f"{agent_name}.{org_name}"
-            query_params.append(f"serviceHost={service_host}")
-
-        # Add body data if available
         if parsed_body_data:
-            body_json = json.dumps(parsed_body_data)
-            body_encoded = base64.b64encode(body_json.encode("utf-8")).decode("utf-8")
-            query_params.append(f"body={body_encoded}")
-
-        # Construct final WebSocket URL
-        if query_params:
-            ws_url = f"{base_ws_url}?{'&amp;'.join(query_params)}"
+            # Add body data to the WebSocket URL. The production URL already
+            # carries serviceHost, and the URL is embedded in XML.
+            base_ws_url = get_websocket_url(host)
+            separator = "&amp;" if "?" in base_ws_url else "?"
+            body_encoded = pybase64.b64encode(orjson.dumps(parsed_body_data))
+            # Standard base64 uses "+", "/" and "=", so percent-encode the value
+            query = urllib.parse.urlencode({"body": body_encoded})
+            ws_url = f"{base_ws_url}{separator}{query}"
+
+            # Generate XML response for Plivo
+            xml_content = _ANSWER_XML_TEMPLATE % ws_url.encode("ascii")
         else:
-            ws_url = base_ws_url
+            xml_content = get_answer_xml_without_body(host)
 
-        # Generate XML response for Plivo
-        xml_content = f"""<?xml version="1.0" encoding="UTF-8"?>
-<Response>
-    <Stream bidirectional="true" keepCallAlive="true" contentType="audio/x-mulaw;rate=8000">
-        {ws_url}
-    </Stream>
-</Response>"""
-
-        return HTMLResponse(content=xml_content, media_type="application/xml")
+        return Response(content=xml_content, media_type="application/xml")
 
     except Exception as e:
-        print(f"Error generating answer XML: {e}")
+        logger.error(f"Error generating answer XML: {e}")
         raise HTTPException(status_code=500, detail=f"Failed to generate XML: {str(e)}")
 
 
@@ -257,36 +322,31 @@ async def websocket_endpoint(
 ):
     """Handle WebSocket connection from Plivo Media Streams."""
     await websocket.accept()
-    print("WebSocket connection accepted for outbound call")
+    logger.info("WebSocket connection accepted for outbound call")
 
-    print(f"Received query params - body: {body}, serviceHost: {serviceHost}")
+    logger.info(f"Received query params - body: {body}, serviceHost: {serviceHost}")
 
     # Decode body parameter if provided
     body_data = {}
     if body:
         try:
             # Base64 decode the JSON (it was base64-encoded in the answer endpoint)
-            decoded_json = base64.b64decode(body).decode("utf-8")
-            body_data = json.loads(decoded_json)
-            print(f"Decoded body data: {body_data}")
+            decoded_json = pybase64.b64decode(body, validate=True)
+            body_data = orjson.loads(decoded_json)
+            logger.info(f"Decoded body data: {body_data}")
         except Exception as e:
-            print(f"Error decoding body parameter: {e}")
+            logger.error(f"Error decoding body parameter: {e}")
     else:
-        print("No body parameter received")
+        logger.info("No body parameter received")
 
     try:
-        # Import the bot function from the bot module
-        from pipecat.runner.types import WebSocketRunnerArguments
-
-        from bot import bot
-
         # Create runner arguments with body data
         runner_args = WebSocketRunnerArguments(websocket=websocket, body=body_data)
 
         await bot(runner_args)
 
     except Exception as e:
-        print(f"Error in WebSocket endpoint: {e}")
+        logger.error(f"Error in WebSocket endpoint: {e}")
         await websocket.close()
 
 
@@ -294,4 +354,12 @@ async def websocket_endpoint(
 
 
 if __name__ == "__main__":
-    uvicorn.run(app, host="0.0.0.0", port=7860)
+    # uvloop isn't available on Windows, so fall back to the asyncio loop there
+    try:
+        import uvloop  # noqa: F401
+
+        loop = "uvloop"
+    except ImportError:
+        loop = "asyncio"
+
+    uvicorn.run(app, host="0.0.0.0", port=7860, loop=loop, http="httptools", ws="websockets")
@@ -37,6 +37,11 @@ from pipecat.workers.runner import WorkerRunner
 
 load_dotenv(override=True)
 
+# Read once at import. Pipecat Cloud reuses the module across sessions.
+DEEPGRAM_API_KEY = os.getenv("DEEPGRAM_API_KEY")
+OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
+CARTESIA_API_KEY = os.getenv("CARTESIA_API_KEY")
+
 # We store functions so transport params don't get instantiated until the
 # desired transport is selected. The function will be called when the desired
 # transport gets selected.
@@ -115,17 +120,17 @@ class PushToTalkUserTurnStrategies(UserTurnStrategies):
 async def run_bot(transport: BaseTransport, runner_args: RunnerArguments):
     logger.info(f"Starting bot")
 
-    stt = DeepgramSTTService(api_key=os.getenv("DEEPGRAM_API_KEY"))
+    stt = DeepgramSTTService(api_key=DEEPGRAM_API_KEY)
 
     tts = CartesiaTTSService(
-        api_key=os.getenv("CARTESIA_API_KEY"),
+        api_key=CARTESIA_API_KEY,
         settings=CartesiaTTSService.Settings(
             voice="71a7ad14-091c-4e8e-a314-022ece01c121",  # British Reading Lady
         ),
     )
 
     llm = OpenAILLMService(
-        api_key=os.getenv("OPENAI_API_KEY"),
+        api_key=OPENAI_API_KEY,
         settings=OpenAILLMService.Settings(
             system_instruction="You are a helpful assistant. Your output will be converted to audio so don't include special characters in your answers. Respond to what the user said in a creative and helpful way.",
         ),
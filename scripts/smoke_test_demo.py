@@ -10,33 +10,105 @@ Exit codes:
 """
 
 import argparse
+import asyncio
 import json
 import os
-import select
 import signal
-import subprocess
 import sys
 import time
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 
+@lru_cache(maxsize=1)
+def load_demo_manifest(manifest_path: Path) -> dict[str, dict[str, Any]]:
+    """Load the demo manifest, indexed by demo path."""
+    demos: list[dict[str, Any]] = json.loads(manifest_path.read_bytes())
+    return {demo["path"]: demo for demo in demos}
+
+
 def find_demo_config(demo_path: str, manifest_path: Path) -> dict[str, Any] | None:
     """Find demo configuration from manifest."""
     if not manifest_path.exists():
         return None
 
-    with open(manifest_path) as f:
-        demos: list[dict[str, Any]] = json.load(f)
+    return load_demo_manifest(manifest_path).get(demo_path)
+
 
-    for demo in demos:
-        if demo["path"] == demo_path:
-            return demo
+OUTPUT_FLUSH_BYTES = 4096
+OUTPUT_FLUSH_INTERVAL_SECS = 0.1
+OUTPUT_READ_BYTES = 65536
 
-    return None
 
+def write_output(output: bytearray) -> None:
+    """Write buffered process output to stdout and clear the buffer."""
+    # Flush anything print() has buffered first so the output stays in order.
+    # The binary buffer retries partial writes, unlike a bare os.write().
+    sys.stdout.flush()
+    sys.stdout.buffer.write(output)
+    sys.stdout.buffer.flush()
+    output.clear()
 
-def run_demo_with_timeout(
+
+async def stream_output(stream: asyncio.StreamReader) -> None:
+    """Copy a process's output to stdout as it arrives.
+
+    Output is buffered and written in batches, once 4 KiB have accumulated or
+    the oldest buffered output is 100ms old, instead of one write per line.
+    It's read in chunks rather than lines, so long lines can't hit the
+    reader's line length limit.
+    """
+    loop = asyncio.get_running_loop()
+    output = bytearray()
+    flush_at = 0.0
+    while True:
+        try:
+            chunk = await asyncio.wait_for(
+                stream.read(OUTPUT_READ_BYTES),
+                timeout=max(0.0, flush_at - loop.time()) if output else None,
+            )
+        except TimeoutError:
+            write_output(output)
+            continue
+
+        if not chunk:
+            break
+
+        if not output:
+            flush_at = loop.time() + OUTPUT_FLUSH_INTERVAL_SECS
+        output += chunk
+        if len(output) >= OUTPUT_FLUSH_BYTES or loop.time() >= flush_at:
+            write_output(output)
+
+    if output:
+        write_output(output)
+
+
+async def stop_process_group(process: asyncio.subprocess.Process) -> None:
+    """Stop a process and its children, escalating to SIGKILL if needed."""
+    if process.returncode is None:
+        print("\nStopping demo...")
+    # The run command goes through a shell, so signal the whole process group
+    # to reach the demo itself. The process leads its own session, so its pid
+    # is the group id. Signal it even if the shell has exited: background
+    # children can outlive it and keep the output pipe, and so process.wait(),
+    # from finishing.
+    try:
+        os.killpg(process.pid, signal.SIGTERM)
+    except ProcessLookupError:
+        pass
+    try:
+        await asyncio.wait_for(process.wait(), timeout=5)
+    except TimeoutError:
+        try:
+            os.killpg(process.pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+        await process.wait()
+
+
+async def run_demo_with_timeout(
     demo_path: str, run_command: str, timeout: int, workspace_root: Path
 ) -> int:
     """
@@ -58,89 +130,62 @@ def run_demo_with_timeout(
     print(f"Working directory: {demo_dir}")
     print("-" * 60)
 
-    # First run uv sync to ensure dependencies are installed
-    print("Installing dependencies with 'uv sync'...")
-    sync_result = subprocess.run(
-        ["uv", "sync"],
-        cwd=demo_dir,
-        capture_output=True,
-        text=True,
-    )
-    if sync_result.returncode != 0:
+    # First run uv sync to ensure dependencies are installed. Its output goes
+    # straight to our stdout/stderr instead of being buffered.
+    print("Installing dependencies with 'uv sync'...", flush=True)
+    sync_process = await asyncio.create_subprocess_exec("uv", "sync", cwd=demo_dir)
+    if await sync_process.wait() != 0:
         print(f"Error: uv sync failed")
-        print(sync_result.stderr)
         return 2
     print("Dependencies installed successfully")
     print("-" * 60)
 
-    start_time = time.time()
+    start_time = time.monotonic()
     process = None
+    output_task = None
 
     try:
         # Start the demo process
-        process = subprocess.Popen(
+        process = await asyncio.create_subprocess_shell(
             run_command,
-            shell=True,
             cwd=demo_dir,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-            text=True,
-            preexec_fn=os.setsid,  # Create new process group for cleanup
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT,
+            start_new_session=True,  # Create new process group for cleanup
         )
+        output_task = asyncio.create_task(stream_output(process.stdout))
+
+        # Wait for the process to exit, for at most the timeout period
+        try:
+            returncode = await asyncio.wait_for(process.wait(), timeout=timeout)
+        except TimeoutError:
+            print(f"\n✅ Demo ran successfully for {timeout} seconds")
+            return 0
+
+        # Process exited - print any remaining output
+        await output_task
+        elapsed = time.monotonic() - start_time
+
+        if returncode == 0:
+            print(f"\n✅ Demo exited cleanly after {elapsed:.1f} seconds")
+            return 0
+        else:
+            print(f"\n❌ Demo crashed after {elapsed:.1f} seconds with exit code {returncode}")
+            return 1
 
-        # Monitor the process for the timeout period
-        while True:
-            elapsed = time.time() - start_time
-
-            # Check if we've reached the timeout
-            if elapsed >= timeout:
-                print(f"\n✅ Demo ran successfully for {timeout} seconds")
-                return 0
-
-            # Check if process has exited
-            poll_result = process.poll()
-            if poll_result is not None:
-                # Process exited - read any remaining output
-                remaining_output, _ = process.communicate(timeout=5)
-                if remaining_output:
-                    print(remaining_output, end="")
-
-                if poll_result == 0:
-                    print(f"\n✅ Demo exited cleanly after {elapsed:.1f} seconds")
-                    return 0
-                else:
-                    print(
-                        f"\n❌ Demo crashed after {elapsed:.1f} seconds with exit code {poll_result}"
-                    )
-                    return 1
-
-            # Use select to read output without blocking (with 0.5s timeout)
-            if process.stdout:
-                readable, _, _ = select.select([process.stdout], [], [], 0.5)
-                if readable:
-                    line = process.stdout.readline()
-                    if line:
-                        print(line, end="")
-
-    except KeyboardInterrupt:
-        print("\nInterrupted by user")
-        return 1
     except Exception as e:
         print(f"\nError running demo: {e}")
         return 1
     finally:
         # Clean up the process and its children
-        if process and process.poll() is None:
-            print("\nStopping demo...")
+        if process:
+            await stop_process_group(process)
+        # Write out whatever the demo printed before it was stopped
+        if output_task:
             try:
-                # Kill the process group
-                os.killpg(os.getpgid(process.pid), signal.SIGTERM)
-                process.wait(timeout=5)
+                await asyncio.wait_for(output_task, timeout=5)
             except Exception:
-                try:
-                    os.killpg(os.getpgid(process.pid), signal.SIGKILL)
-                except Exception:
-                    pass
+                pass
 
 
 def main():
@@ -188,12 +233,18 @@ def main():
         print(f"Error: No run command found for demo: {args.demo_path}")
         return 2
 
-    return run_demo_with_timeout(
-        args.demo_path,
-        run_command,
-        args.timeout,
-        args.workspace_root,
-    )
+    try:
+        return asyncio.run(
+            run_demo_with_timeout(
+                args.demo_path,
+                run_command,
+                args.timeout,
+                args.workspace_root,
+            )
+        )
+    except KeyboardInterrupt:
+        print("\nInterrupted by user")
+        return 1
 
 
 if __name__ == "__main__":
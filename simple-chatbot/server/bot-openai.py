@@ -29,15 +29,12 @@ import os
 
 from dotenv import load_dotenv
 from loguru import logger
-from PIL import Image
 from pipecat.audio.vad.silero import SileroVADAnalyzer
 from pipecat.frames.frames import (
     BotStartedSpeakingFrame,
     BotStoppedSpeakingFrame,
     Frame,
     LLMRunFrame,
-    OutputImageRawFrame,
-    SpriteFrame,
 )
 from pipecat.pipeline.pipeline import Pipeline
 from pipecat.pipeline.worker import PipelineParams, PipelineWorker
@@ -57,27 +54,26 @@ from pipecat.transports.smallwebrtc.connection import SmallWebRTCConnection
 from pipecat.transports.smallwebrtc.transport import SmallWebRTCTransport
 from pipecat.workers.runner import WorkerRunner
 
-load_dotenv(override=True)
+from sprites import load_sprites
 
-sprites = []
-script_dir = os.path.dirname(__file__)
+load_dotenv(override=True)
 
-# Load sequential animation frames
-for i in range(1, 26):
-    # Build the full path to the image file
-    full_path = os.path.join(script_dir, f"assets/robot0{i}.png")
-    # Get the filename without the extension to use as the dictionary key
-    # Open the image and convert it to bytes
-    with Image.open(full_path) as img:
-        sprites.append(OutputImageRawFrame(image=img.tobytes(), size=img.size, format=img.format))
+# Read API keys once at import, so a missing key is reported at startup
+# instead of when the first session connects
+DEEPGRAM_API_KEY = os.getenv("DEEPGRAM_API_KEY")
+ELEVENLABS_API_KEY = os.getenv("ELEVENLABS_API_KEY")
+OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
 
-# Create a smooth animation by adding reversed frames
-flipped = sprites[::-1]
-sprites.extend(flipped)
+for _name, _value in (
+    ("DEEPGRAM_API_KEY", DEEPGRAM_API_KEY),
+    ("ELEVENLABS_API_KEY", ELEVENLABS_API_KEY),
+    ("OPENAI_API_KEY", OPENAI_API_KEY),
+):
+    if not _value:
+        logger.error(f"{_name} is not set")
 
-# Define static and animated states
-quiet_frame = sprites[0]  # Static frame for when bot is listening
-talking_frame = SpriteFrame(images=sprites)  # Animation sequence for when bot is talking
+# Static frame for when bot is listening, and animation for when bot is talking
+quiet_frame, talking_frame = load_sprites(os.path.join(os.path.dirname(__file__), "assets"))
 
 
 class TalkingAnimation(FrameProcessor):
@@ -100,15 +96,20 @@ class TalkingAnimation(FrameProcessor):
         """
         await super().process_frame(frame, direction)
 
+        # Every frame in the pipeline passes through here. Neither speaking frame
+        # has subclasses, so an exact type check is enough and skips isinstance.
+        frame_type = type(frame)
+
         # Switch to talking animation when bot starts speaking
-        if isinstance(frame, BotStartedSpeakingFrame):
+        if frame_type is BotStartedSpeakingFrame:
             if not self._is_talking:
                 await self.push_frame(talking_frame)
                 self._is_talking = True
         # Return to static frame when bot stops speaking
-        elif isinstance(frame, BotStoppedSpeakingFrame):
-            await self.push_frame(quiet_frame)
-            self._is_talking = False
+        elif frame_type is BotStoppedSpeakingFrame:
+            if self._is_talking:
+                await self.push_frame(quiet_frame)
+                self._is_talking = False
 
         await self.push_frame(frame, direction)
 
@@ -118,11 +119,11 @@ async def run_bot(transport: BaseTransport, runner_args: RunnerArguments):
     logger.info("Starting bot")
 
     # Speech-to-Text service
-    stt = DeepgramSTTService(api_key=os.getenv("DEEPGRAM_API_KEY"))
+    stt = DeepgramSTTService(api_key=DEEPGRAM_API_KEY)
 
     # Text-to-Speech service
     tts = ElevenLabsTTSService(
-        api_key=os.getenv("ELEVENLABS_API_KEY"),
+        api_key=ELEVENLABS_API_KEY,
         settings=ElevenLabsTTSService.Settings(
             voice="pNInz6obpgDQGcFmaJgB",
         ),
@@ -130,7 +131,7 @@ async def run_bot(transport: BaseTransport, runner_args: RunnerArguments):
 
     # LLM service
     llm = OpenAILLMService(
-        api_key=os.getenv("OPENAI_API_KEY"),
+        api_key=OPENAI_API_KEY,
         settings=OpenAILLMService.Settings(
             system_instruction="You are Chatbot, a friendly, helpful robot. Your goal is to demonstrate your capabilities in a succinct way. Your output will be converted to audio so don't include special characters in your answers. Respond to what the user said in a creative and helpful way, but keep your responses brief. Start by introducing yourself.",
         ),
@@ -0,0 +1,65 @@
+#
+# Copyright (c) 2024–2025, Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+"""Robot avatar sprites shared by the bot implementations.
+
+The animation frames are decoded once per process, no matter how many bot
+modules ask for them.
+"""
+
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+from PIL import Image
+from pipecat.frames.frames import OutputImageRawFrame, SpriteFrame
+
+# Animation frame file names: robot01.png, robot02.png, ...
+_FRAME_NAME_RE = re.compile(r"robot0(\d+)\.png")
+
+
+def _load_frame(path: str) -> OutputImageRawFrame:
+    """Decode a single animation frame."""
+    # Open the image and convert it to bytes
+    with Image.open(path) as img:
+        return OutputImageRawFrame(image=img.tobytes(), size=img.size, format=img.format)
+
+
+@lru_cache(maxsize=None)
+def load_sprites(asset_dir: str) -> tuple[OutputImageRawFrame, SpriteFrame]:
+    """Load the robot animation frames from the assets directory.
+
+    Args:
+        asset_dir: Directory containing the robot01.png, robot02.png, ... frames.
+
+    Returns:
+        The static frame shown while the bot is listening, and the animation
+        played while it is talking.
+    """
+    # List the frames with a single directory read. The frame numbers aren't
+    # zero-padded (robot09.png, robot010.png), so sort them numerically.
+    frames = []
+    for name in os.listdir(asset_dir):
+        if match := _FRAME_NAME_RE.fullmatch(name):
+            frames.append((int(match[1]), os.path.join(asset_dir, name)))
+    if not frames:
+        raise FileNotFoundError(f"No robot sprite frames found in {asset_dir}")
+    paths = [path for _, path in sorted(frames)]
+
+    # Load sequential animation frames. Pillow releases the GIL while decoding,
+    # so the PNGs are decoded in parallel.
+    with ThreadPoolExecutor(max_workers=min(8, len(paths))) as executor:
+        sprites = list(executor.map(_load_frame, paths))
+
+    # Create a smooth animation by adding reversed frames. These reuse the same
+    # frame objects, so the image data is only held once.
+    sprites.extend(sprites[::-1])
+
+    # Define static and animated states
+    quiet_frame = sprites[0]  # Static frame for when bot is listening
+    talking_frame = SpriteFrame(images=sprites)  # Animation sequence for when bot is talking
+    return quiet_frame, talking_frame
@@ -5,10 +5,13 @@
 #
 
 
-import io
+import asyncio
 import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 
 import aiohttp
+import pypdfium2 as pdfium
 import tiktoken
 from dotenv import load_dotenv
 from loguru import logger
@@ -30,7 +33,6 @@ from pipecat.transports.base_transport import BaseTransport, TransportParams
 from pipecat.transports.daily.transport import DailyParams
 from pipecat.transports.websocket.fastapi import FastAPIWebsocketParams
 from pipecat.workers.runner import WorkerRunner
-from pypdf import PdfReader
 
 load_dotenv(override=True)
 
@@ -53,12 +55,31 @@ transport_params = {
 }
 
 
+@lru_cache(maxsize=4)
+def _get_encoding(model_name):
+    return tiktoken.encoding_for_model(model_name)
+
+
 # Count number of tokens used in model and truncate the content
 def truncate_content(content, model_name):
-    encoding = tiktoken.encoding_for_model(model_name)
-    tokens = encoding.encode(content)
-
     max_tokens = 10000
+
+    # Every token covers at least one byte, so short content never needs
+    # tokenizing.
+    if len(content.encode()) <= max_tokens:
+        return content
+
+    encoding = _get_encoding(model_name)
+
+    # Only the first max_tokens tokens are kept, so tokenize a prefix that
+    # comfortably covers them (BPE averages 3-4 characters per token) rather
+    # than the whole article. Fall back to the full content in the unlikely
+    # case that the prefix comes up short.
+    max_chars = max_tokens * 6
+    tokens = encoding.encode(content[:max_chars])
+    if len(tokens) <= max_tokens and len(content) > max_chars:
+        tokens = encoding.encode(content)
+
     if len(tokens) > max_tokens:
         truncated_tokens = tokens[:max_tokens]
         return encoding.decode(truncated_tokens)
@@ -136,18 +157,46 @@ async def get_arxiv_content(url: str, aiohttp_session: aiohttp.ClientSession):
             return "Failed to download arXiv PDF."
 
         content = await response.read()
-        pdf_file = io.BytesIO(content)
-        pdf_reader = PdfReader(pdf_file)
-        text = ""
-        for page in pdf_reader.pages:
-            text += page.extract_text()
-        return text
+        return await extract_pdf_text(content)
+
+
+# Helper function to extract the text of a PDF. PDFium is a native library, so
+# it runs in a thread to keep the event loop free while extracting. PDFium isn't
+# thread-safe, even across documents, so every session shares a single thread.
+_pdf_executor = ThreadPoolExecutor(max_workers=1)
+
+
+def _extract_pdf_text(pdf_bytes: bytes) -> str:
+    # Close every PDFium object here so none is finalized later on another thread
+    pdf = pdfium.PdfDocument(pdf_bytes)
+    try:
+        texts = []
+        for page in pdf:
+            textpage = page.get_textpage()
+            texts.append(textpage.get_text_range())
+            textpage.close()
+            page.close()
+        return "".join(texts)
+    finally:
+        pdf.close()
+
+
+async def extract_pdf_text(pdf_bytes: bytes) -> str:
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_pdf_executor, _extract_pdf_text, pdf_bytes)
 
 
 async def run_bot(transport: BaseTransport, runner_args: RunnerArguments):
     logger.info(f"Starting bot")
 
-    url = input("Enter the URL of the article you would like to talk about: ")
+    # Use the article URL from the session request body when one is sent (e.g.
+    # when deployed), otherwise ask for it on the console without blocking the
+    # event loop.
+    url = (runner_args.body or {}).get("url")
+    if not url:
+        url = await asyncio.to_thread(
+            input, "Enter the URL of the article you would like to talk about: "
+        )
 
     # Set up headers with User-Agent for all requests
     headers = {
@@ -155,8 +204,11 @@ async def run_bot(transport: BaseTransport, runner_args: RunnerArguments):
     }
 
     async with aiohttp.ClientSession(headers=headers) as session:
-        article_content = await get_article_content(url, session)
-        article_content = truncate_content(article_content, model_name="gpt-4o-mini")
+        # Download the article while the services are set up. Yield once so the
+        # request gets going (the DNS lookup runs in a thread) before the
+        # synchronous service construction below.
+        article_task = asyncio.create_task(get_article_content(url, session))
+        await asyncio.sleep(0)
 
         stt = DeepgramSTTService(api_key=os.getenv("DEEPGRAM_API_KEY"))
 
@@ -167,6 +219,8 @@ async def run_bot(transport: BaseTransport, runner_args: RunnerArguments):
             ),
         )
 
+        article_content = truncate_content(await article_task, model_name="gpt-4o-mini")
+
         system_instruction = f"""You are an AI study partner. You have been given the following article content:
 
     {article_content}
@@ -209,7 +209,7 @@ class BotStoppedSpeakingNotifier(FrameProcessor):
 
         # Check if this is a BotStoppedSpeakingFrame
         if isinstance(frame, BotStoppedSpeakingFrame):
-            logger.debug(f"{self}: Host bot stopped speaking, notifying listeners")
+            logger.debug("{}: Host bot stopped speaking, notifying listeners", self)
             await self._notifier.notify()
 
         # Always push the frame through
@@ -228,7 +228,8 @@ class StartGate(FrameProcessor):
     def __init__(self, notifier: BaseNotifier):
         super().__init__()
         self._notifier = notifier
-        self._gate_opened = False
+        # An Event rather than a bool, so other tasks can await the gate opening
+        self._gate_opened = asyncio.Event()
         self._gate_task: Optional[asyncio.Task] = None
 
     async def setup(self, setup: FrameProcessorSetup):
@@ -250,12 +251,15 @@ class StartGate(FrameProcessor):
     async def process_frame(self, frame: Frame, direction: FrameDirection):
         await super().process_frame(frame, direction)
 
-        if self._gate_opened:
+        if self._gate_opened.is_set():
             # Once the gate is open, let everything through
             await self.push_frame(frame, direction)
         elif isinstance(frame, LLMContextFrame):
             # Drop these frames until the gate opens - we want to ignore this audio
-            logger.trace(f"{self}: Dropping {type(frame).__name__} until host bot stops speaking")
+            # Let loguru format the message only if TRACE is enabled
+            logger.trace(
+                "{}: Dropping {} until host bot stops speaking", self, type(frame).__name__
+            )
 
             # Start the gate task if not already running
 
@@ -269,8 +273,8 @@ class StartGate(FrameProcessor):
             await self._notifier.wait()
 
             # Gate is now open - only run this code once
-            if not self._gate_opened:
-                self._gate_opened = True
+            if not self._gate_opened.is_set():
+                self._gate_opened.set()
                 logger.debug(f"{self}: Gate opened, all frames will now pass through")
 
         except asyncio.CancelledError: